@@ -1,47 +1,170 @@
 #!/usr/bin/env python3
+import array
+import errno
+import gc
+import logging
 import os
+import pickle
+import select
+import struct
+import sys
 import time
 import traceback
+from dataclasses import dataclass
 from pathlib import Path
-import argparse
 from typing import List, Optional, Dict, Tuple, Any, Union, cast, Sequence
 
 from evdev import InputDevice, ecodes, UInput
 from evdev.device import AbsInfo
 
-# ─────── GLOBAL VARS (set by command line) ───────
-# Will be populated by parse_args()
-ARGS: Optional[argparse.Namespace] = None
+try:
+    import pyudev
+except ImportError:
+    pyudev = None  # type: ignore[assignment]
+
+log = logging.getLogger("gamepad")
+
+# Layout of struct input_event: timeval (two longs), type, code, value.
+EVENT_FORMAT: str = "llHHi"
+EVENT_SIZE: int = struct.calcsize(EVENT_FORMAT)
+# How many events one os.read() can pull in a single syscall.
+EVENT_BATCH: int = 64
+_pack_event = struct.Struct(EVENT_FORMAT).pack
+
+# Capability dict as handed to evdev.UInput.
+Capabilities = Dict[int, Union[List[int], List[Tuple[int, AbsInfo]]]]
+
+# Extracted capabilities are cached on disk per (vendor, product, version)
+# so reconnects of a known pad skip the capability ioctls entirely.
+CACHE_DIR: str = os.environ.get('GAMEPAD_CACHE_DIR', '/var/cache/gamepad-proxy')
 
 # ─────── ARGUMENT PARSING ───────
-def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
-    parser = argparse.ArgumentParser(description="Gamepad Docker Binding Script")
-    parser.add_argument('--device-link', type=str, default='/dev/input/by-id/usb-1038_SteelSeries_Stratus_Duo-event-joystick',
-                        help='Path to the real gamepad device link')
-    parser.add_argument('--event-path', type=str, default='/tmp/gamepad-event',
-                        help='Desired path for the event symlink')
-    parser.add_argument('--js-path', type=str, default='/tmp/gamepad-js',
-                        help='Desired path for the joystick symlink')
-    parser.add_argument('--virtual-name', type=str, default='VirtualGamepad',
-                        help='Name for the virtual gamepad device')
-    return parser.parse_args(argv)
+# Option name (sans --, dashes as underscores) → (default, help text).
+OPTIONS: Dict[str, Tuple[str, str]] = {
+    'device_link': ('/dev/input/by-id/usb-1038_SteelSeries_Stratus_Duo-event-joystick',
+                    'Path to the real gamepad device link'),
+    'event_path': ('/tmp/gamepad-event',
+                   'Desired path for the event symlink'),
+    'js_path': ('/tmp/gamepad-js',
+                'Desired path for the joystick symlink'),
+    'virtual_name': ('VirtualGamepad',
+                     'Name for the virtual gamepad device'),
+}
+
+@dataclass
+class Args:
+    device_link: str = OPTIONS['device_link'][0]
+    event_path: str = OPTIONS['event_path'][0]
+    js_path: str = OPTIONS['js_path'][0]
+    virtual_name: str = OPTIONS['virtual_name'][0]
+
+
+# Defaults are derived from OPTIONS once at import; parse_args just copies.
+_DEFAULTS: Dict[str, str] = {name: default for name, (default, _) in OPTIONS.items()}
+
+
+def _usage() -> str:
+    lines: List[str] = ["usage: gamepad-mapper [OPTIONS]", "", "Gamepad Docker Binding Script", ""]
+    for name, (default, help_text) in OPTIONS.items():
+        lines.append(f"  --{name.replace('_', '-')} VALUE  {help_text} (default: {default})")
+    return "\n".join(lines)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> Args:
+    """
+    Parse command-line options into an Args instance.
+
+    Hand-rolled scan instead of argparse: four string options don't
+    justify argparse's import chain and parser construction on a script
+    that restarts with device hotplug.  Accepts --key value and
+    --key=value, and exits with status 2 on unknown or incomplete
+    options just as argparse would.
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    values: Dict[str, str] = dict(_DEFAULTS)
+    tokens = iter(argv)
+    for token in tokens:
+        if token in ('-h', '--help'):
+            print(_usage())
+            raise SystemExit(0)
+        flag, sep, inline = token.partition('=')
+        name: str = flag[2:].replace('-', '_') if flag.startswith('--') else ''
+        if name not in values:
+            print(f"error: unrecognized argument: {token}\n{_usage()}", file=sys.stderr)
+            raise SystemExit(2)
+        if sep:
+            values[name] = inline
+        else:
+            try:
+                values[name] = next(tokens)
+            except StopIteration:
+                print(f"error: argument {flag}: expected one value", file=sys.stderr)
+                raise SystemExit(2)
+    return Args(**values)
+
+# ─────── GLOBAL VARS (set by command line) ───────
+# Will be populated by parse_args()
+ARGS: Optional[Args] = None
 
 # ─────── UTILITY FUNCTIONS ───────
 
+# Lazily-started udev monitor shared across reconnects (see _wait_for_input_change).
+_UDEV_MONITOR: Optional[Any] = None
+
+def _wait_for_input_change() -> None:
+    """
+    Block until udev reports activity on the input subsystem.
+    Falls back to a 1 s sleep when pyudev is not installed.
+    """
+    global _UDEV_MONITOR
+    if pyudev is None:
+        time.sleep(1)
+        return
+    if _UDEV_MONITOR is None:
+        context = pyudev.Context()
+        monitor = pyudev.Monitor.from_netlink(context)
+        monitor.filter_by('input')
+        monitor.start()
+        _UDEV_MONITOR = monitor
+        # The device may have appeared between the caller's probe and the
+        # monitor starting; return so the caller re-probes with the monitor
+        # now armed.
+        return
+    # Blocks until any input uevent (add/remove/change) arrives; the caller
+    # re-probes the device link afterwards.
+    _UDEV_MONITOR.poll()
+
+
 def wait_for_device() -> InputDevice:
     """Block until the real gamepad appears and can be opened."""
     while True:
-        if ARGS and os.path.exists(ARGS.device_link):
+        if ARGS:
+            # EAFP: opening directly saves the stat() an exists() probe
+            # would cost on every attempt; absence is just another miss.
             try:
                 dev = InputDevice(ARGS.device_link)
-                print(f"✅ Opened real device: {dev.name}")
-                return dev
             except Exception as e:
-                print(f"⚠️ Could not open real device: {e}")
-        time.sleep(1)
+                # This fires once per wait iteration; keep it off stdout.
+                log.debug("Could not open real device: %s", e)
+            else:
+                try:
+                    # Grab immediately so no events leak to other consumers
+                    # in the window between open and the forward loop
+                    # starting.
+                    dev.grab()
+                    os.set_inheritable(dev.fd, False)
+                    print(f"✅ Opened real device: {dev.name}")
+                    return dev
+                except Exception as e:
+                    # EBUSY when another process holds the grab; close the
+                    # device so retrying doesn't leak an fd per uevent.
+                    dev.close()
+                    log.debug("Could not grab real device: %s", e)
+        _wait_for_input_change()
 
 
-def extract_capabilities(dev: InputDevice) -> Dict[int, Union[List[int], List[Tuple[int, AbsInfo]]]]:
+def extract_capabilities(dev: InputDevice) -> Capabilities:
     """
     Extract device capabilities:
       - EV_KEY: list of button codes (ints)
@@ -49,34 +172,16 @@ def extract_capabilities(dev: InputDevice) -> Dict[int, Union[List[int], List[Tu
       - EV_FF:  list of ff codes (ints)
     Returns a dict suitable for evdev.UInput.
     """
+    # capabilities(absinfo=True) already embeds an AbsInfo per ABS code, so
+    # no per-axis dev.absinfo() ioctls are needed.
     raw: Dict[int, Any] = dev.capabilities(absinfo=True) # type: ignore
-    caps: Dict[int, Union[List[int], List[Tuple[int, AbsInfo]]]] = {}
+    caps: Capabilities = {}
 
     # Keys
     caps[ecodes.EV_KEY] = raw.get(ecodes.EV_KEY, [])
 
-    # Absolute axes
-    abs_list: List[Tuple[int, AbsInfo]] = []
-    # raw.get(ecodes.EV_ABS, []) can return List[int] or List[Tuple[int, AbsInfo]]
-    # depending on whether absinfo was True or False in dev.capabilities()
-    # if it's List[int], we need to call dev.absinfo() for each code
-    for entry in raw.get(ecodes.EV_ABS, []):
-        if isinstance(entry, tuple) and len(entry) == 2 and isinstance(entry[1], AbsInfo):
-            code, info = entry[0], entry[1]
-        else: # Should be an int if absinfo=False, but we called with absinfo=True
-              # However, to be safe, and handle if dev.capabilities(absinfo=True) still returns codes for some reason
-            code = entry if isinstance(entry, int) else entry[0] # type: ignore
-            try:
-                abs_info_val = dev.absinfo(code)
-                if abs_info_val is not None: # absinfo can return None
-                    info = abs_info_val
-                else:
-                    print(f"⚠️ Could not get absinfo for {code}, it was None.")
-                    continue
-            except Exception as e:
-                print(f"⚠️ Could not get absinfo for {code}: {e}")
-                continue
-        abs_list.append((code, info))
+    # Absolute axes: already [(code, AbsInfo), ...]
+    abs_list: List[Tuple[int, AbsInfo]] = list(raw.get(ecodes.EV_ABS, []))
     if abs_list:
         caps[ecodes.EV_ABS] = abs_list
 
@@ -85,64 +190,210 @@ def extract_capabilities(dev: InputDevice) -> Dict[int, Union[List[int], List[Tu
     if ff:
         caps[ecodes.EV_FF] = ff
 
-    print("DEBUG: extracted capabilities =", caps)
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("extracted capabilities = %s", caps)
+    return caps
+
+
+# Set once splice() has been seen to fail on these character devices, so
+# later reconnects skip straight to the read/write path.
+_SPLICE_UNSUPPORTED: bool = not hasattr(os, 'splice')
+
+def _forward_splice(fd_in: int, fd_out: int) -> bool:
+    """
+    Shuttle events from fd_in to fd_out entirely in-kernel via splice(),
+    never returning while the devices are healthy.  Returns False without
+    forwarding anything if either side refuses splice (evdev/uinput support
+    varies by kernel), in which case the caller uses the read/write path.
+    Device errors (disconnects) propagate as OSError.
+    """
+    global _SPLICE_UNSUPPORTED
+    if _SPLICE_UNSUPPORTED:
+        return False
+    pipe_r, pipe_w = os.pipe()
+    try:
+        while True:
+            try:
+                n: int = os.splice(fd_in, pipe_w, EVENT_SIZE * EVENT_BATCH)
+            except OSError as e:
+                if e.errno in (errno.EINVAL, errno.ENOSYS):
+                    _SPLICE_UNSUPPORTED = True
+                    return False
+                raise
+            if n == 0:
+                raise OSError("device returned EOF")
+            while n:
+                try:
+                    n -= os.splice(pipe_r, fd_out, n)
+                except OSError as e:
+                    if e.errno not in (errno.EINVAL, errno.ENOSYS):
+                        raise
+                    # uinput refuses to be a splice sink: drain what's
+                    # already in the pipe by hand, then fall back.
+                    while n:
+                        chunk: bytes = os.read(pipe_r, n)
+                        os.write(fd_out, chunk)
+                        n -= len(chunk)
+                    _SPLICE_UNSUPPORTED = True
+                    return False
+    finally:
+        os.close(pipe_r)
+        os.close(pipe_w)
+
+
+def build_code_remap() -> 'array.array[int]':
+    """
+    Build the source→destination event-code table used by the forward loop.
+
+    A flat array indexed by code (KEY_MAX bounds every code space evdev
+    uses) keeps the per-event lookup a plain C index instead of a dict
+    probe.  The default table is the identity; remapping a button or axis
+    is just overwriting its slot.
+    """
+    return array.array('H', range(ecodes.KEY_MAX + 1))
+
+
+# In-memory memo for get_capabilities(), keyed like the disk cache, so
+# hotplugs of the same pad within one run cost zero ioctls and zero I/O.
+_CAPS_MEMO: Dict[Tuple[int, int, int], Capabilities] = {}
+
+def get_capabilities(dev: InputDevice) -> Capabilities:
+    """
+    Return the capability dict for dev, consulting the in-memory memo,
+    then the on-disk cache, and only then the device itself.
+    """
+    key: Tuple[int, int, int] = (dev.info.vendor, dev.info.product, dev.info.version)
+    caps: Optional[Capabilities] = _CAPS_MEMO.get(key)
+    if caps is not None:
+        return caps
+    caps = load_cached_capabilities(*key)
+    if caps is None:
+        caps = extract_capabilities(dev)
+        store_cached_capabilities(*key, caps)
+    _CAPS_MEMO[key] = caps
     return caps
 
 
-def create_symlinks() -> bool:
+def _caps_cache_path(vendor: int, product: int, version: int) -> str:
+    return os.path.join(CACHE_DIR, f"{vendor:04x}:{product:04x}:{version:04x}.pkl")
+
+
+def load_cached_capabilities(vendor: int, product: int, version: int) -> Optional[Capabilities]:
+    """Return the cached capability dict for this pad, or None on any miss."""
+    try:
+        with open(_caps_cache_path(vendor, product, version), 'rb') as f:
+            return cast(Capabilities, pickle.load(f))
+    except Exception:
+        # A stale or corrupt entry can raise well beyond PickleError
+        # (AttributeError/TypeError/ImportError for e.g. an AbsInfo pickled
+        # under a different evdev version); any read failure is just a miss.
+        return None
+
+
+def store_cached_capabilities(vendor: int, product: int, version: int,
+                              caps: Capabilities) -> None:
+    """Persist the capability dict; failures only cost the cache, so log and move on."""
+    path: str = _caps_cache_path(vendor, product, version)
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp: str = path + ".tmp"
+        with open(tmp, 'wb') as f:
+            pickle.dump(caps, f)
+        os.replace(tmp, path)
+    except OSError as e:
+        log.debug("Could not cache capabilities at %s: %s", path, e)
+
+
+def create_symlinks(ui: UInput) -> bool:
     """
     Create /tmp/gamepad-event and /tmp/gamepad-js symlinks to the virtual device.
+
+    The virtual device's own node (ui.device.path, e.g. /dev/input/event23)
+    pins down its sysfs entry directly, so only that one input node is
+    inspected rather than scanning every device under /sys/class/input.
     """
-    sys_input: str = '/sys/class/input'
     if ARGS is None:
         print("❌ ARGS not set, cannot create symlinks.")
         return False
 
-    for entry in os.listdir(sys_input):
-        if not entry.startswith('input'):
-            continue
-        name_file: str = os.path.join(sys_input, entry, 'name')
-        try:
-            with open(name_file) as f:
-                name: str = f.read().strip()
-        except FileNotFoundError:
-            continue
-        if name != ARGS.virtual_name:
+    if ui.device is None:
+        print("❌ Virtual device node not available, cannot create symlinks.")
+        return False
+
+    # evdev types the path as str | bytes; fsdecode normalizes it.
+    event_node: str = os.path.basename(os.fsdecode(ui.device.path))  # e.g. "event23"
+    # /sys/class/input/event23/device is the parent input node holding both
+    # the eventX and jsY children.
+    sys_device: str = os.path.join('/sys/class/input', event_node, 'device')
+    try:
+        children: List[str] = os.listdir(sys_device)
+    except OSError as e:
+        print(f"❌ Could not inspect {sys_device}: {e}")
+        return False
+
+    for child in children:
+        src: str = ""
+        dst: str = ""
+        if child.startswith('event'):
+            src, dst = f"/dev/input/{child}", ARGS.event_path
+        elif child.startswith('js'):
+            src, dst = f"/dev/input/{child}", ARGS.js_path
+        else:
             continue
-        # Found virtual device: link its eventX and jsY
-        for child in os.listdir(os.path.join(sys_input, entry)):
-            src: str = ""
-            dst: str = ""
-            if child.startswith('event'):
-                src, dst = f"/dev/input/{child}", ARGS.event_path
-            elif child.startswith('js'):
-                src, dst = f"/dev/input/{child}", ARGS.js_path
-            else:
-                continue
-            if os.path.exists(src):
-                # Create parent directory if it doesn't exist
-                dst_dir = os.path.dirname(dst)
-                if not os.path.exists(dst_dir):
-                    os.makedirs(dst_dir)
+        if os.path.exists(src):
+            # Create parent directory if it doesn't exist
+            dst_dir = os.path.dirname(dst)
+            os.makedirs(dst_dir, exist_ok=True)
 
+            # Build the link at a temp path and rename it into place so
+            # consumers never observe a window where dst is missing.
+            tmp: str = dst + ".tmp"
+            try:
                 try:
-                    if os.path.islink(dst) or os.path.exists(dst):
-                        os.unlink(dst)
+                    os.unlink(tmp)
                 except FileNotFoundError:
-                    pass # This is fine, means it didn't exist
-                except OSError as e:
-                    print(f"Error removing existing symlink/file {dst}: {e}")
-                    continue # Skip creating this symlink
+                    pass
+                os.symlink(src, tmp)
+                os.replace(tmp, dst)
+                print(f"🔗 {dst} → {src}")
+            except OSError as e:
+                print(f"Error creating symlink from {src} to {dst}: {e}")
 
-                try:
-                    os.symlink(src, dst)
-                    print(f"🔗 {dst} → {src}")
-                except OSError as e:
-                    print(f"Error creating symlink from {src} to {dst}: {e}")
+    return True
 
-        return True # Found and processed the virtual device
-    print(f"❌ Could not find {ARGS.virtual_name} to symlink")
-    return False
+def apply_latency_tuning() -> None:
+    """
+    Opt-in scheduling tweaks for latency-sensitive setups, driven by env vars:
+      GAMEPAD_CPU    — pin the process to this CPU (ideally isolated)
+      GAMEPAD_RTPRIO — run under SCHED_FIFO at this priority, with the
+                       process memory locked so it never page-faults
+    Both fail soft — missing privileges just log a warning.
+    """
+    cpu: Optional[str] = os.environ.get('GAMEPAD_CPU')
+    if cpu is not None:
+        try:
+            os.sched_setaffinity(0, {int(cpu)})
+            print(f"📌 Pinned to CPU {cpu}")
+        except (ValueError, OSError) as e:
+            log.warning("Could not pin to CPU %s: %s", cpu, e)
+    prio: Optional[str] = os.environ.get('GAMEPAD_RTPRIO')
+    if prio is not None:
+        try:
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(int(prio)))
+            print(f"⏱ SCHED_FIFO priority {prio}")
+        except (ValueError, OSError) as e:
+            log.warning("Could not set SCHED_FIFO priority %s: %s", prio, e)
+        else:
+            # An RT task that page-faults still stalls; pin the (tiny)
+            # resident set.  MCL_CURRENT | MCL_FUTURE == 3.
+            try:
+                import ctypes
+                # mlockall reports failure via -1 + errno, never by raising.
+                if ctypes.CDLL(None, use_errno=True).mlockall(3) != 0:
+                    log.warning("mlockall failed: %s",
+                                os.strerror(ctypes.get_errno()))
+            except OSError as e:
+                log.warning("mlockall unavailable: %s", e)
 
 # ─────── MAIN LOOP ───────
 
@@ -154,12 +405,12 @@ def run() -> None:
 
     # 1) Open the real device once, extract IDs…
     real: InputDevice = wait_for_device()
-    caps: Dict[int, Union[List[int], List[Tuple[int, AbsInfo]]]] = extract_capabilities(real)
     # grab the original bus/vendor/product/version
     bus: int = real.info.bustype
     vendor: int = real.info.vendor
     product: int = real.info.product
     version: int = real.info.version
+    caps: Capabilities = get_capabilities(real)
     real.close()
 
     # 2) Create the virtual device with matching IDs
@@ -173,26 +424,95 @@ def run() -> None:
     )
     print("🎮 Virtual device created (IDs matched).")
 
-    create_symlinks()
+    create_symlinks(ui)
+
+    apply_latency_tuning()
+
+    remap: 'array.array[int]' = build_code_remap()
+
+    # Steady-state forwarding allocates (almost) nothing, so the cyclic
+    # collector only adds pause risk to the loop; freeze what exists now
+    # and collect manually on the rare disconnect path instead.
+    gc.freeze()
+    gc.disable()
 
     # Forward loop
+    ready_announced: bool = False
     while True:
+        dev: Optional[InputDevice] = None
         try:
-            dev: InputDevice = wait_for_device()
-            dev.grab()
+            dev = wait_for_device()  # returned already grabbed
             print("▶️ Forwarding events...")
-            for e in dev.read_loop():
-                if e is not None: # read_loop can yield None
-                    print(f"DEBUG: incoming event - type={e.type}, code={e.code}, value={e.value}")
-                    ui.write(e.type, e.code, e.value)
-                    ui.syn()
+            if not ready_announced:
+                # Machine-readable readiness marker for supervisors and the
+                # test harness.  Emitted only now, with the source device
+                # grabbed: announcing after create_symlinks() would leave a
+                # window where injected events have no reader and the input
+                # core silently drops them.
+                print("READY", flush=True)
+                ready_announced = True
+            debug: bool = log.isEnabledFor(logging.DEBUG)
+            # With the identity remap (and no per-event logging) nothing in
+            # the stream needs rewriting, so forward the raw bytes verbatim:
+            # uinput accepts input_event structs as evdev emits them and
+            # restamps the timestamps itself.
+            passthrough: bool = not debug and remap == build_code_remap()
+            # Read raw input_event structs instead of going through
+            # dev.read_loop(), which allocates an InputEvent object per
+            # struct.  struct.iter_unpack decodes a whole batch in C.
+            fd: int = dev.fd
+            os.set_blocking(fd, True)
+            if passthrough:
+                # Try the fully in-kernel splice() path first; it returns
+                # False (having forwarded nothing) when unsupported, in
+                # which case the read/write loop below takes over.
+                _forward_splice(fd, ui.fd)
+            # poll() surfaces POLLHUP/POLLERR the moment the device goes
+            # away, so disconnects re-enter the udev wait immediately
+            # instead of surfacing as a delayed read error.
+            poller = select.poll()
+            poller.register(fd, select.POLLIN | select.POLLERR | select.POLLHUP)
+            # Events between two SYN_REPORTs are coalesced into one write()
+            # to /dev/uinput, so each report costs a single syscall instead
+            # of one per sub-event.  The source's own SYN_REPORT marks the
+            # frame boundary, so uinput sees the original report groups.
+            pending: bytearray = bytearray()
+            while True:
+                for _fd, mask in poller.poll():
+                    if mask & (select.POLLERR | select.POLLHUP):
+                        raise OSError("device hung up")
+                data: bytes = os.read(fd, EVENT_SIZE * EVENT_BATCH)
+                if not data:
+                    raise OSError("device returned EOF")
+                if passthrough:
+                    os.write(ui.fd, data)
+                    continue
+                for sec, usec, etype, ecode, evalue in struct.iter_unpack(EVENT_FORMAT, data):
+                    if debug:
+                        log.debug("evt t=%d c=%d v=%d", etype, ecode, evalue)
+                    pending += _pack_event(sec, usec, etype, remap[ecode], evalue)
+                    if etype == ecodes.EV_SYN and ecode == ecodes.SYN_REPORT:
+                        os.write(ui.fd, bytes(pending))
+                        pending.clear()
         except (OSError, IOError) as ex:
+            # wait_for_device() blocks on the udev monitor, so no extra
+            # sleep is needed before retrying.
             print(f"🔌 Disconnected: {ex}, waiting...")
-            time.sleep(1)
+            gc.collect()
         except Exception:
             print("💥 Unexpected error:")
             traceback.print_exc()
+            gc.collect()
             time.sleep(1)
+        finally:
+            # Release the grab before retrying: a still-open fd (e.g. after
+            # a uinput write error or the generic handler) would make every
+            # reopen fail EBUSY against our own stale grab.
+            if dev is not None:
+                try:
+                    dev.close()
+                except OSError:
+                    pass
 
 def main(cli_args: Optional[List[str]] = None) -> None:
     """
@@ -201,6 +521,9 @@ def main(cli_args: Optional[List[str]] = None) -> None:
     """
     global ARGS
     ARGS = parse_args(cli_args)
+    # Per-event diagnostics are opt-in: GAMEPAD_LOG=DEBUG enables them,
+    # keeping the forwarding loop free of string formatting by default.
+    logging.basicConfig(level=os.environ.get('GAMEPAD_LOG', 'INFO'))
     run()
 
 if __name__ == '__main__':
@@ -0,0 +1,276 @@
+import errno # For error number constants
+import os
+import select
+import shutil
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+import types
+from pathlib import Path
+from typing import IO, List, Tuple, Dict, Mapping, Optional, Iterator, Union, cast, Sequence
+
+import pytest
+from evdev import UInput, ecodes, AbsInfo
+from evdev.uinput import UInputError
+
+# Capabilities of the mock "real" gamepad the integration tests forward
+# from.  Read-only (MappingProxyType over tuples) so nothing can mutate
+# the shared definition between tests now that the fixtures are
+# session-scoped.
+CAPS: Mapping[int, Union[Tuple[int, ...], Tuple[Tuple[int, AbsInfo], ...]]] = types.MappingProxyType({
+    ecodes.EV_KEY: (ecodes.BTN_A, ecodes.BTN_B),
+    ecodes.EV_ABS: ((ecodes.ABS_X, AbsInfo(value=0, min=0, max=255, fuzz=0, flat=0, resolution=0)),),
+})
+MOCK_REAL_DEVICE_NAME: str = "MockRealGamepadForTest"
+GAMEPAD_SCRIPT_VIRTUAL_NAME: str = "TestVirtualGamepad"
+
+# Resolved once at import: the fixture shouldn't re-stat the script per
+# session, and sys.executable avoids a PATH lookup plus guarantees the
+# forwarder runs under the same interpreter as pytest.
+SCRIPT_PATH: Path = (Path(__file__).parent.parent / "gamepad.py").resolve()
+assert SCRIPT_PATH.exists(), f"gamepad.py not found at {SCRIPT_PATH}"
+
+# Set by the makereport hook below; session teardown consults it so the
+# captured subprocess output is only decoded when something failed.
+_ANY_TEST_FAILED: bool = False
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item: pytest.Item,
+                              call: "pytest.CallInfo[None]") -> Iterator[None]:
+    outcome = yield
+    report: pytest.TestReport = outcome.get_result()  # type: ignore[attr-defined]
+    if report.when == "call" and report.failed:
+        global _ANY_TEST_FAILED
+        _ANY_TEST_FAILED = True
+
+
+@pytest.fixture(scope="session")
+def symlink_dir(tmp_path_factory: pytest.TempPathFactory) -> Iterator[Path]:
+    """
+    Directory holding the forwarder's test symlinks.  Prefer /dev/shm — a
+    pure-RAM tmpfs, so the link create/stat/unlink churn never touches a
+    disk-backed filesystem — and fall back to pytest's session tmp dir
+    when it isn't writable.
+    """
+    # Worker-unique name so concurrent xdist workers never share links.
+    worker: str = os.environ.get("PYTEST_XDIST_WORKER", "main")
+    shm: Path = Path("/dev/shm")
+    if shm.is_dir() and os.access(shm, os.W_OK):
+        d: Path = shm / f"gamepad_tests_{worker}"
+        d.mkdir(exist_ok=True)
+        yield d
+        shutil.rmtree(d, ignore_errors=True)
+    else:
+        yield tmp_path_factory.mktemp("gamepad_tests")
+
+
+@pytest.fixture(scope="session")
+def event_symlink(symlink_dir: Path) -> Path:
+    return symlink_dir / "event"
+
+
+@pytest.fixture(scope="session")
+def js_symlink(symlink_dir: Path) -> Path:
+    return symlink_dir / "js"
+
+
+def _rm(path: Path) -> None:
+    """
+    Remove path if present, including a dangling symlink.  Path.exists()
+    follows links and reports False for a dangling one, so the old
+    exists-then-unlink pattern both double-stat()ed and missed stale links.
+    """
+    try:
+        path.unlink(missing_ok=True)
+    except IsADirectoryError:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def _captured_output(proc: "subprocess.Popen[bytes]", stdout_seen: bytearray,
+                     stderr_file: IO[bytes]) -> Tuple[str, str]:
+    """
+    Decode the subprocess's output for diagnostics.  stdout_seen holds the
+    bytes consumed while waiting for READY; the child must already be dead
+    so draining the rest of its stdout pipe cannot block.
+    """
+    rest: bytes = b""
+    if proc.stdout is not None:
+        try:
+            rest = proc.stdout.read() or b""
+        except (OSError, ValueError):
+            pass
+    stderr_file.seek(0)
+    return ((bytes(stdout_seen) + rest).decode(errors='ignore'),
+            stderr_file.read().decode(errors='ignore'))
+
+
+def _fail_premature_exit(proc: "subprocess.Popen[bytes]", stdout_seen: bytearray,
+                         stderr_file: IO[bytes]) -> None:
+    proc.wait()
+    stdout_text, stderr_text = _captured_output(proc, stdout_seen, stderr_file)
+    print(f"gamepad.py terminated prematurely. Stdout: {stdout_text}, Stderr: {stderr_text}")
+    pytest.fail("gamepad.py terminated prematurely during startup.")
+
+
+def _wait_for_ready(proc: "subprocess.Popen[bytes]", timeout: float,
+                    stdout_seen: bytearray,
+                    stderr_file: IO[bytes]) -> bool:
+    """
+    Block until gamepad.py prints its READY line (emitted once the
+    forward loop has the source device grabbed, which implies the
+    symlinks are installed), or return False on timeout.  One select()
+    wakeup per chunk of child output replaces the old filesystem watch on
+    the symlink directory; everything read is kept in stdout_seen for
+    later diagnostics.  Monotonic deadline: wall-clock slew (NTP steps)
+    must not shorten or stretch the wait.
+    """
+    assert proc.stdout is not None
+    fd: int = proc.stdout.fileno()
+    deadline: float = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            _fail_premature_exit(proc, stdout_seen, stderr_file)
+        remaining: float = deadline - time.monotonic()
+        ready, _, _ = select.select([fd], [], [], max(0.0, min(remaining, 0.1)))
+        if not ready:
+            continue
+        chunk: bytes = os.read(fd, 4096)
+        if not chunk:  # EOF: the child is exiting.
+            _fail_premature_exit(proc, stdout_seen, stderr_file)
+        stdout_seen += chunk
+        if any(line.strip() == b"READY" for line in stdout_seen.splitlines()):
+            return True
+    return False
+
+
+# Errnos indicating /dev/uinput is missing or inaccessible on this host:
+# those environments skip rather than fail.
+SKIP_ERRNOS: frozenset = frozenset({errno.EACCES, errno.ENOENT, errno.ENODEV})
+
+
+@pytest.fixture(scope="session")
+def mock_real_gamepad() -> Iterator[Tuple[UInput, str]]:
+    ui_real: Optional[UInput] = None # Define ui_real before try block for consistent access in finally
+    real_device_event_path: Optional[str] = None
+    try:
+        print(f"Attempting to create mock real gamepad: {MOCK_REAL_DEVICE_NAME} with events: {CAPS}")
+        ui_real = UInput(events=cast(Optional[Dict[int, Sequence[int]]], CAPS), name=MOCK_REAL_DEVICE_NAME, version=0x1)
+        if ui_real.device:
+            real_device_event_path = ui_real.device.path
+        else:
+            # This case should ideally not be reached if UInput constructor worked and device is None.
+            # If it were, real_device_event_path would remain None.
+            pytest.fail("Mock real gamepad device path is None after creation.")
+
+        assert real_device_event_path is not None, "real_device_event_path should not be None if yield is reached"
+        print(f"Mock real gamepad created at {real_device_event_path}")
+        yield ui_real, real_device_event_path
+    except (UInputError, PermissionError, OSError) as e:
+        # Decide skip vs fail on errno rather than scanning exception text;
+        # UInputError wraps the original OSError without an errno, so fall
+        # back to spotting 'uinput' in its message for that one case.
+        err: Optional[int] = getattr(e, 'errno', None)
+        if err in SKIP_ERRNOS or isinstance(e, PermissionError) or 'uinput' in str(e).lower():
+            pytest.skip(f"Skipping test: /dev/uinput is unavailable or inaccessible ({e}). Configure udev rules or group membership.")
+        pytest.fail(f"Failed to create mock_real_gamepad: {e}")
+    except Exception as e: # Catch any other unexpected exception during UInput creation
+        pytest.fail(f"Failed to create mock_real_gamepad due to unexpected error: {e}")
+    finally:
+        print("Cleaning up mock real gamepad...")
+        if ui_real and hasattr(ui_real, 'device') and ui_real.device:
+            ui_real.close()
+        elif ui_real: # If ui_real was created but device wasn't (e.g. due to path issue)
+             ui_real.close()
+
+
+@pytest.fixture(scope="session")
+def gamepad_process(mock_real_gamepad: Tuple[UInput, str],
+                    event_symlink: Path, js_symlink: Path) -> Iterator[subprocess.Popen[bytes]]: # Depends on the above fixture
+    _, real_device_event_path = mock_real_gamepad
+
+    _rm(event_symlink)
+    _rm(js_symlink)
+
+    args_list: List[str] = [
+        sys.executable, str(SCRIPT_PATH),
+        "--device-link", real_device_event_path,
+        "--event-path", str(event_symlink),
+        "--js-path", str(js_symlink),
+        "--virtual-name", GAMEPAD_SCRIPT_VIRTUAL_NAME
+    ]
+
+    proc: Optional[subprocess.Popen[bytes]] = None
+    # stdout is a pipe so the READY line wakes the fixture directly; the
+    # forwarder prints nothing per event, so the unread pipe can't fill up
+    # and exert back-pressure during tests.  stderr still goes to an
+    # unlinked temp file, which never blocks a chatty child and can be
+    # read back for diagnostics.
+    stdout_seen: bytearray = bytearray()
+    stderr_file = tempfile.TemporaryFile()
+    try:
+        print(f"Starting gamepad.py with args: {' '.join(args_list)}")
+        # close_fds=False skips the post-fork /proc/self/fd scan (the child
+        # only inherits the redirected stdio anyway); start_new_session puts
+        # the child in its own process group so teardown can killpg it.
+        # bufsize=0 keeps the stdout pipe unbuffered on our side so select()
+        # and os.read() see the READY line the moment it arrives.
+        proc = subprocess.Popen(args_list, stdout=subprocess.PIPE, stderr=stderr_file,
+                                bufsize=0, close_fds=False, start_new_session=True)
+
+        # READY is printed once the forward loop holds the grabbed source
+        # device, so when it arrives both symlinks exist and events written
+        # to the mock pad have a reader; the open-retry loop in the tests
+        # handles the symlink target's device node appearing slightly later.
+        became_ready: bool = _wait_for_ready(proc, timeout=15.0,
+                                             stdout_seen=stdout_seen, stderr_file=stderr_file)
+
+        if not became_ready:
+            # Kill before capturing output so the snapshot is final and a
+            # wedged child can't prolong the failure path.
+            try:
+                os.killpg(proc.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+            proc.wait()
+            stdout_text, stderr_text = _captured_output(proc, stdout_seen, stderr_file)
+            print(f"gamepad.py stdout: {stdout_text}")
+            print(f"gamepad.py stderr: {stderr_text}")
+            pytest.fail("Timeout waiting for gamepad.py to report READY.")
+
+        print("gamepad.py started and reported READY.")
+        yield proc
+    finally:
+        if proc:
+            print("Terminating gamepad.py process...")
+            # Signal the whole group so nothing the forwarder spawned outlives it.
+            try:
+                os.killpg(proc.pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+            try:
+                proc.wait(timeout=5)
+                exit_note: str = "exited"
+            except subprocess.TimeoutExpired:
+                print("gamepad.py did not terminate gracefully, killing.")
+                try:
+                    os.killpg(proc.pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
+                proc.wait()
+                exit_note = "killed"
+            # Decoding the captured output is a full pass over the bytes;
+            # skip it on a clean run where nothing will read the dump.
+            if _ANY_TEST_FAILED:
+                stdout_text, stderr_text = _captured_output(proc, stdout_seen, stderr_file)
+                print(f"gamepad.py {exit_note}. Stdout: {stdout_text}, Stderr: {stderr_text}")
+            else:
+                print(f"gamepad.py {exit_note}.")
+            if proc.stdout is not None:
+                proc.stdout.close()
+        stderr_file.close()
+
+        _rm(event_symlink)
+        _rm(js_symlink)
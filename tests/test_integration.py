@@ -0,0 +1,176 @@
+import queue
+import select
+import stat
+import struct
+import subprocess
+import threading
+import time
+import os
+from typing import Iterator, List, Tuple
+
+import pytest
+
+# Collection-time gate: without evdev the forwarding tests can't run at all.
+pytest.importorskip("evdev")
+from evdev import UInput, ecodes, InputDevice
+from pathlib import Path
+
+# Skip the whole module at collection when /dev/uinput isn't writable, so
+# runners without uinput never pay for fixture setup; the errno check in
+# mock_real_gamepad stays as the backstop for subtler open failures.
+pytestmark = pytest.mark.skipif(not os.access("/dev/uinput", os.W_OK),
+                                reason="/dev/uinput not writable")
+
+
+# Kernel input_event layout, matching gamepad.py's EVENT_FORMAT.
+EVENT_STRUCT = struct.Struct("llHHi")
+
+
+def _wait_device(path: str, deadline: float) -> InputDevice:
+    """
+    Open the device behind path as soon as it is ready, polling every 20 ms
+    until deadline (time.monotonic() based).  The stat/S_ISCHR probe filters
+    out the window where the symlink exists but its target node doesn't yet.
+    """
+    while time.monotonic() < deadline:
+        try:
+            st: os.stat_result = os.stat(path)
+            if stat.S_ISCHR(st.st_mode):
+                return InputDevice(path)
+        except (FileNotFoundError, PermissionError):
+            pass
+        time.sleep(0.02)
+    pytest.fail(f"Timed out waiting for a character device at {path}")
+
+
+def _drain_pending_events(dev: InputDevice) -> None:
+    """Discard any queued events so parametrized cases stay independent."""
+    try:
+        while dev.read_one():
+            pass
+    except BlockingIOError:
+        pass
+
+
+@pytest.fixture(scope="session")
+def virtual_dev(gamepad_process: "subprocess.Popen[bytes]",
+                event_symlink: Path) -> Iterator[InputDevice]:
+    """
+    One InputDevice shared by every forwarding case.  Opening evdev
+    devices triggers a capability-probing ioctl cascade, so the open is
+    amortized across the parametrized batches; cases stay independent by
+    draining pending events before sending.
+    """
+    dev: InputDevice = _wait_device(str(event_symlink),
+                                    deadline=time.monotonic() + 5.0)
+    print(f"Successfully opened gamepad.py's virtual device: {dev.name}")
+    yield dev
+    dev.close()
+
+
+# Each case is the (type, code, value) batch sent through the mock real pad;
+# the same tuples are expected back out of the virtual device.  The fixtures
+# are session-scoped, so every extra case here reuses the running forwarder.
+# ABS values must differ from the axis's current position (initially 0) —
+# the input core drops identical-value ABS events — and from each other,
+# so every case passes regardless of which ran before it.
+FORWARDING_CASES: List[List[Tuple[int, int, int]]] = [
+    [
+        (ecodes.EV_KEY, ecodes.BTN_A, 1),
+        (ecodes.EV_KEY, ecodes.BTN_A, 0),
+        (ecodes.EV_ABS, ecodes.ABS_X, 128),
+    ],
+    [
+        (ecodes.EV_KEY, ecodes.BTN_B, 1),
+        (ecodes.EV_KEY, ecodes.BTN_B, 0),
+        (ecodes.EV_ABS, ecodes.ABS_X, 200),
+    ],
+]
+
+# All forwarding cases share the session-scoped uinput device and
+# forwarder subprocess, so under xdist they must land on one worker.
+@pytest.mark.xdist_group("uinput")
+@pytest.mark.parametrize("events_to_send", FORWARDING_CASES)
+def test_event_forwarding(mock_real_gamepad: Tuple[UInput, str],
+                          virtual_dev: InputDevice,
+                          events_to_send: List[Tuple[int, int, int]]) -> None:
+    ui_real: UInput
+    ui_real, _ = mock_real_gamepad
+    dev_virtual: InputDevice = virtual_dev
+
+    # No EVIOCGRAB: the test is the only reader of the virtual device, so
+    # an exclusive grab buys nothing; draining pending events is what keeps
+    # parametrized cases independent.
+    _drain_pending_events(dev_virtual)
+
+    # A background thread feeds the received tuples through a queue, so the
+    # test can stop the moment the expected events have all arrived instead
+    # of draining a fixed 2 s window.  It reads the fd raw — up to 64
+    # input_event structs per os.read(), decoded with iter_unpack — rather
+    # than through read_loop(), which allocates one InputEvent object per
+    # struct and dominates the receive path on large batches.
+    received_q: "queue.Queue[Tuple[int, int, int]]" = queue.Queue()
+    stop_reading = threading.Event()
+
+    def _reader() -> None:
+        fd: int = dev_virtual.fd
+        try:
+            while not stop_reading.is_set():
+                ready, _, _ = select.select([fd], [], [], 0.1)
+                if not ready:
+                    continue
+                buf: bytes = os.read(fd, EVENT_STRUCT.size * 64)
+                for _sec, _usec, etype, ecode, evalue in EVENT_STRUCT.iter_unpack(buf):
+                    received_q.put((etype, ecode, evalue))
+        except (OSError, ValueError):
+            return  # Device closed during test teardown.
+
+    reader_thread = threading.Thread(target=_reader, daemon=True)
+    reader_thread.start()
+
+    # Pre-pack the whole batch plus its SYN_REPORT and hand the kernel a
+    # single write(): evdev's write()/syn() methods cost one syscall per
+    # event.  uinput restamps the zeroed timestamps itself.  The
+    # queue-based reader observes arrival, so no propagation sleep is
+    # needed.
+    print(f"Sending events to mock real device: {events_to_send}")
+    send_buf: bytes = b"".join(
+        EVENT_STRUCT.pack(0, 0, etype, ecode, evalue)
+        for etype, ecode, evalue in events_to_send
+    ) + EVENT_STRUCT.pack(0, 0, ecodes.EV_SYN, ecodes.SYN_REPORT, 0)
+    os.write(ui_real.fd, send_buf)
+
+    # One absolute monotonic deadline bounds the whole collection phase;
+    # each queue get() waits only for the time that remains, so a slow
+    # trickle of events cannot stretch the test past 2 s total.
+    expected_core_events_tuples: List[Tuple[int, int, int]] = events_to_send
+    events_received: List[Tuple[int, int, int]] = []
+    deadline: float = time.monotonic() + 2.0
+    try:
+        while not all(e in events_received for e in expected_core_events_tuples):
+            remaining: float = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            events_received.append(received_q.get(timeout=remaining))
+    except queue.Empty:
+        pass  # Timed out; the assertions below report what is missing.
+
+    stop_reading.set()
+    reader_thread.join(0.5)
+
+    print(f"Raw events received: {events_received}")
+    # Filter out SYN_REPORT and MSC_SCAN events which are often auto-generated or not part of core test.
+    # Sets keep the missing-events check O(N+M) as parametrized batches grow.
+    filtered_events_received: frozenset[Tuple[int, int, int]] = frozenset(
+        (t, c, v) for (t, c, v) in events_received
+        if t != ecodes.EV_SYN and not (t == ecodes.EV_MSC and c == ecodes.MSC_SCAN)
+    )
+    print(f"Filtered events received: {sorted(filtered_events_received)}")
+
+    expected_set: frozenset[Tuple[int, int, int]] = frozenset(expected_core_events_tuples)
+    missing_events: frozenset[Tuple[int, int, int]] = expected_set - filtered_events_received
+    if missing_events:
+        pytest.fail(f"Missing expected core events: {sorted(missing_events)}. Received (filtered): {sorted(filtered_events_received)}")
+
+    assert len(filtered_events_received) == len(expected_set), \
+        f"Expected {len(expected_set)} core events, but got {len(filtered_events_received)} (after filtering SYN/MSC)"
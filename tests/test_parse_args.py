@@ -0,0 +1,47 @@
+import pytest
+from gamepad import Args, parse_args # Assuming gamepad.py is in the parent directory or PYTHONPATH is set
+
+# Expected defaults; every attribute not overridden by a case below must
+# come back with these values.
+DEFAULTS = {
+    'device_link': '/dev/input/by-id/usb-1038_SteelSeries_Stratus_Duo-event-joystick',
+    'event_path': '/tmp/gamepad-event',
+    'js_path': '/tmp/gamepad-js',
+    'virtual_name': 'VirtualGamepad',
+}
+
+# (argv, expected overrides) — one row per former standalone test: empty
+# command line, each flag alone, all flags together, and empty values.
+CASES = [
+    ([], {}),
+    (["--device-link", "/dev/input/my-custom-device"],
+     {'device_link': "/dev/input/my-custom-device"}),
+    (["--event-path", "/tmp/my-custom-event"],
+     {'event_path': "/tmp/my-custom-event"}),
+    (["--js-path", "/tmp/my-custom-js"],
+     {'js_path': "/tmp/my-custom-js"}),
+    (["--virtual-name", "MyCoolGamepad"],
+     {'virtual_name': "MyCoolGamepad"}),
+    (["--device-link", "/dev/input/another-device",
+      "--event-path", "/opt/ev",
+      "--js-path", "/opt/js",
+      "--virtual-name", "SuperGamepad"],
+     {'device_link': "/dev/input/another-device",
+      'event_path': "/opt/ev",
+      'js_path': "/opt/js",
+      'virtual_name': "SuperGamepad"}),
+    (["--device-link", "", "--event-path", "", "--js-path", "", "--virtual-name", ""],
+     {'device_link': "", 'event_path': "", 'js_path': "", 'virtual_name': ""}),
+]
+
+
+@pytest.mark.parametrize("argv,expected", CASES)
+def test_parse_args(argv: list, expected: dict) -> None:
+    # Args is a dataclass, so vars() yields its field dict: one equality
+    # check covers every attribute and reports all mismatches at once.
+    args: Args = parse_args(argv)
+    assert vars(args) == {**DEFAULTS, **expected}
+
+def test_unknown_argument() -> None:
+    with pytest.raises(SystemExit):
+        parse_args(["--unknown-arg", "value"])